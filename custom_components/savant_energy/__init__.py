@@ -3,18 +3,18 @@ Integration for Savant Energy.
 Provides Home Assistant integration for Savant relay and energy monitoring devices.
 """
 
+import asyncio
 import logging
 from datetime import timedelta, datetime
 import os
-import traceback
 
 import homeassistant.helpers.config_validation as cv  # type: ignore
 import voluptuous as vol  # type: ignore
 
 from homeassistant.config_entries import ConfigEntry  # type: ignore
 from homeassistant.core import HomeAssistant  # type: ignore
+from homeassistant.helpers.aiohttp_client import async_get_clientsession  # type: ignore
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator  # type: ignore
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry  # type: ignore
 from homeassistant.helpers.translation import async_get_translations  # type: ignore
 from homeassistant.components import frontend  # type: ignore
 
@@ -25,9 +25,16 @@ from .const import (
     CONF_PORT,
     CONF_SCAN_INTERVAL,
     DEFAULT_OLA_PORT,
+    CONF_DMX_ADDRESS_CACHE,
+    DEFAULT_DMX_ADDRESS_CACHE,
+)
+from .models import build_device_info
+from .snapshot_data import async_get_current_energy_snapshot
+from .utils import (
+    async_get_dmx_address,
+    calculate_dmx_uid,
+    DMX_CACHE_SECONDS,
 )
-from .snapshot_data import get_current_energy_snapshot
-from .utils import async_get_all_dmx_status, DMX_CACHE_SECONDS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +51,9 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+# DMX addresses are configured on the relays and change rarely
+DMX_ADDRESS_UPDATE_INTERVAL = timedelta(minutes=15)
+
 # Lovelace card file information
 LOVELACE_CARD_FILENAME = "savant-energy-scenes-card.js"
 
@@ -69,12 +79,86 @@ class SavantEnergyCoordinator(DataUpdateCoordinator):
             logger=_LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # Snapshots are plain dicts, so unchanged polls can skip listener callbacks
+            always_update=False,
         )
         self.address = entry.data[CONF_ADDRESS]
         self.port = entry.data[CONF_PORT]
         self.config_entry = entry  # Store config entry directly
         self.dmx_data = {}  # Mapping of channel -> status (for debugging)
         self.dmx_last_update = None
+        # UIDs whose presentDemands entry changed on the last refresh (None = notify all)
+        self._changed_uids = None
+        self._device_infos = {}  # uid -> DeviceInfo shared by every platform
+        self.dmx_address_coordinator = None  # Set up right after the first refresh
+        self.relay_entity_ids = {}  # uid -> relay status binary_sensor entity_id, kept by the sensors
+        self.relay_state_by_uid = {}  # uid -> last commanded/observed breaker state, kept by the switches
+        # Last SET_ENERGY payload and its parsed result for this controller
+        self._snapshot_cache = {"payload": None, "result": None}
+
+    def get_device(self, uid: str):
+        """
+        Return the latest presentDemands entry for a device UID.
+        Args:
+            uid: Device UID
+        Returns:
+            The device dict from the current snapshot, or None if it is not present.
+        """
+        if not self.data:
+            return None
+        return self.data["snapshot_data"]["presentDemands_by_uid"].get(uid)
+
+    def get_device_info(self, device: dict):
+        """
+        Return the DeviceInfo for a device, building it only once per config entry.
+        Args:
+            device: Device dict from presentDemands
+        Returns:
+            The DeviceInfo shared by every entity of this device across all platforms.
+        """
+        uid = device["uid"]
+        device_info = self._device_infos.get(uid)
+        if device_info is None:
+            device_info = build_device_info(device, calculate_dmx_uid(uid))
+            self._device_infos[uid] = device_info
+        return device_info
+
+    def _diff_present_demands(self, snapshot_data):
+        """
+        Compare a new snapshot against the current data by device UID.
+        Args:
+            snapshot_data: Newly fetched snapshot dict
+        Returns:
+            The set of UIDs whose device entry changed, or None if every listener
+            should be notified (first refresh, recovery, or devices added/removed).
+        """
+        if not self.last_update_success:
+            return None
+        previous = (self.data or {}).get("snapshot_data") or {}
+        if "presentDemands" not in previous or "presentDemands" not in snapshot_data:
+            return None
+        old_by_uid = previous["presentDemands_by_uid"]
+        new_by_uid = snapshot_data["presentDemands_by_uid"]
+        if old_by_uid.keys() != new_by_uid.keys():
+            return None
+        return {uid for uid, device in new_by_uid.items() if old_by_uid[uid] != device}
+
+    @property
+    def changed_uids(self):
+        """
+        UIDs whose presentDemands entry changed on the last refresh, or None if
+        every device should be treated as changed.
+        """
+        return self._changed_uids
+
+    def device_changed(self, uid) -> bool:
+        """
+        Return True if a per-device entity needs to handle the current update.
+        Args:
+            uid: Device UID
+        """
+        changed_uids = self._changed_uids
+        return changed_uids is None or not self.last_update_success or uid in changed_uids
 
     async def _async_update_data(self):
         """
@@ -82,10 +166,11 @@ class SavantEnergyCoordinator(DataUpdateCoordinator):
         Returns a dict with snapshot_data and dmx_data.
         Ensures proper error handling and logging to diagnose data issues.
         """
+        self._changed_uids = None
         try:
             # Get snapshot data from energy controller
-            snapshot_data = await self.hass.async_add_executor_job(
-                get_current_energy_snapshot, self.address, self.port
+            snapshot_data = await async_get_current_energy_snapshot(
+                self.address, self.port, self._snapshot_cache
             )
 
             # Log diagnostic information for troubleshooting entity availability
@@ -93,17 +178,19 @@ class SavantEnergyCoordinator(DataUpdateCoordinator):
                 _LOGGER.error(
                     "Received no data from Savant controller - check connection settings"
                 )
+                if self.data is not None:
+                    self._changed_uids = set()  # Nothing new to dispatch
                 return self.data  # Keep previous data rather than None
 
             if "presentDemands" not in snapshot_data:
                 _LOGGER.error(
-                    f"Missing 'presentDemands' in snapshot data: {snapshot_data}"
+                    "Missing 'presentDemands' in snapshot data: %s", snapshot_data
                 )
 
             # Check if we have valid device data to report for debugging
             if "presentDemands" in snapshot_data:
                 device_count = len(snapshot_data["presentDemands"])
-                _LOGGER.debug(f"Retrieved {device_count} devices in presentDemands")
+                _LOGGER.debug("Retrieved %d devices in presentDemands", device_count)
 
                 # Debug log each device found for troubleshooting
                 for device in snapshot_data["presentDemands"]:
@@ -112,9 +199,20 @@ class SavantEnergyCoordinator(DataUpdateCoordinator):
                     has_percent = "percentCommanded" in device
                     if not all([has_uid, has_name, has_percent]):
                         _LOGGER.warning(
-                            f"Incomplete device data: uid={has_uid}, name={has_name}, percentCommanded={has_percent}. Device: {device}"
+                            "Incomplete device data: uid=%s, name=%s, percentCommanded=%s. Device: %s",
+                            has_uid, has_name, has_percent, device,
                         )
 
+            # Index devices by UID so entities can look themselves up in O(1).
+            # Built on a copy: the parsed snapshot is also the parser's cached result.
+            snapshot_data = {
+                **snapshot_data,
+                "presentDemands_by_uid": {
+                    device.get("uid"): device
+                    for device in snapshot_data.get("presentDemands", ())
+                },
+            }
+
             # Update DMX status for debugging if cache expired
             now = datetime.now()
             if (
@@ -126,12 +224,78 @@ class SavantEnergyCoordinator(DataUpdateCoordinator):
                 self.dmx_data = {}
                 self.dmx_last_update = now
 
+            self._changed_uids = self._diff_present_demands(snapshot_data)
             return {"snapshot_data": snapshot_data, "dmx_data": self.dmx_data}
         except Exception as exc:
-            _LOGGER.error(f"Error updating data: {exc}")
+            _LOGGER.error("Error updating data: %s", exc)
             raise
 
 
+class SavantDMXAddressCoordinator(DataUpdateCoordinator):
+    """
+    Coordinator for the DMX addresses of all Savant relay devices.
+    Fetches every device's address from the OLA RDM API in one concurrent batch
+    over a shared HTTP session, instead of one request per sensor entity.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, energy_coordinator):
+        """
+        Initialize the coordinator.
+        Args:
+            hass: Home Assistant instance
+            entry: ConfigEntry for this integration
+            energy_coordinator: SavantEnergyCoordinator providing the device list
+        """
+        super().__init__(
+            hass,
+            logger=_LOGGER,
+            name=f"{DOMAIN}_dmx_address",
+            update_interval=DMX_ADDRESS_UPDATE_INTERVAL,
+            always_update=False,
+        )
+        self.config_entry = entry
+        self.energy_coordinator = energy_coordinator
+
+    async def _async_update_data(self):
+        """
+        Fetch DMX addresses for every known device.
+        Returns a dict mapping DMX UID -> DMX address. Addresses that could not be
+        fetched this round keep their previously known value.
+        """
+        entry = self.config_entry
+        addresses = dict(self.data or {})
+        snapshot_data = (self.energy_coordinator.data or {}).get("snapshot_data") or {}
+        dmx_uids = [
+            calculate_dmx_uid(uid)
+            for uid in snapshot_data.get("presentDemands_by_uid", ())
+            if uid is not None
+        ]
+        cache_enabled = entry.options.get(
+            CONF_DMX_ADDRESS_CACHE,
+            entry.data.get(CONF_DMX_ADDRESS_CACHE, DEFAULT_DMX_ADDRESS_CACHE),
+        )
+        if cache_enabled:
+            dmx_uids = [dmx_uid for dmx_uid in dmx_uids if dmx_uid not in addresses]
+        ip_address = entry.data.get(CONF_ADDRESS)
+        if not dmx_uids or not ip_address:
+            return addresses
+
+        ola_port = entry.data.get("ola_port", DEFAULT_OLA_PORT)
+        session = async_get_clientsession(self.hass)
+        results = await asyncio.gather(
+            *(
+                async_get_dmx_address(ip_address, ola_port, 1, dmx_uid, session)
+                for dmx_uid in dmx_uids
+            )
+        )
+        for dmx_uid, address in zip(dmx_uids, results):
+            if address is not None:
+                addresses[dmx_uid] = address
+            else:
+                _LOGGER.warning("Failed to fetch DMX address for %s", dmx_uid)
+        return addresses
+
+
 async def _async_register_frontend_resource(hass: HomeAssistant) -> None:
     """
     Register the custom Lovelace card using Home Assistant's proper frontend system.
@@ -191,6 +355,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Fetching initial data from Savant Energy controller")
     await coordinator.async_config_entry_first_refresh()
 
+    # DMX addresses are fetched for all devices at once and shared by the entities
+    coordinator.dmx_address_coordinator = SavantDMXAddressCoordinator(
+        hass, entry, coordinator
+    )
+    await coordinator.dmx_address_coordinator.async_refresh()
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     if coordinator.data is None or not coordinator.data.get("snapshot_data"):
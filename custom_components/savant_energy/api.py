@@ -8,7 +8,6 @@ import json
 import voluptuous as vol # type: ignore
 from homeassistant.exceptions import HomeAssistantError # type: ignore
 from .const import DOMAIN 
-from .utils import slugify
 
 _LOGGER = logging.getLogger(__name__)
 
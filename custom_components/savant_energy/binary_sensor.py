@@ -5,32 +5,32 @@ Creates binary sensors for relay status of each Savant device.
 
 import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
-from .models import get_device_model
-from .utils import calculate_dmx_uid
+from .const import DOMAIN, SIGNAL_RELAY_ENTITY_ID
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coordinator-driven entities: no update serialization needed
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """
     Set up Savant Energy binary sensor entities for relay status.
     """
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    await coordinator.async_config_entry_first_refresh()
-    snapshot_data = coordinator.data.get("snapshot_data", {}) if coordinator.data else {}
+    snapshot_data = (coordinator.data or {}).get("snapshot_data") or {}
     entities = []
-    if snapshot_data and "presentDemands" in snapshot_data:
-        for device in snapshot_data["presentDemands"]:
-            if "uid" in device and "percentCommanded" in device:
-                uid = device["uid"]
-                dmx_uid = calculate_dmx_uid(uid)
-                entities.append(
-                    EnergyDeviceBinarySensor(coordinator, device, f"SavantEnergy_{uid}_relay_status", dmx_uid)
-                )
+    for device in snapshot_data.get("presentDemands") or ():
+        if "uid" in device and "percentCommanded" in device:
+            uid = device["uid"]
+            device_info = coordinator.get_device_info(device)
+            entities.append(
+                EnergyDeviceBinarySensor(coordinator, device, f"SavantEnergy_{uid}_relay_status", device_info)
+            )
     async_add_entities(entities)
 
 
@@ -39,103 +39,75 @@ class EnergyDeviceBinarySensor(CoordinatorEntity, BinarySensorEntity):
     Representation of a Savant relay status as a binary sensor.
     Shows ON if the relay is commanded ON, OFF otherwise.
     """
-    def __init__(self, coordinator, device, unique_id, dmx_uid):
-        super().__init__(coordinator)
+    __slots__ = ("_device_uid", "_initial_name", "_last_written")
+    _attr_icon = "mdi:toggle-switch-outline"
+
+    def __init__(self, coordinator, device, unique_id, device_info):
+        super().__init__(coordinator, context=device["uid"])
         self._device_uid = device["uid"]
         self._attr_unique_id = unique_id
-        self._dmx_uid = dmx_uid
-        # Store initial name and capacity for fallbacks and consistent DeviceInfo
+        # Store initial name as a fallback for the dynamic entity name
         self._initial_name = device.get("name", f"Savant Device {self._device_uid}")
-        self._initial_capacity = device.get("capacity", 0)
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(self._device_uid))},
-            name=self._initial_name,  # Use stored initial name
-            serial_number=self._dmx_uid,
-            manufacturer=MANUFACTURER,
-            model=get_device_model(self._initial_capacity),  # Use stored initial capacity
-        )
+        self._attr_device_info = device_info
         self._attr_extra_state_attributes = {"uid": self._device_uid}
+        self._attr_name = f"{self._initial_name} Relay Status"
+        self._last_written = None  # (is_on, available, name, update ok) last sent to HA
+        self._refresh_from_snapshot()
 
-    @property
-    def name(self):
+    def _refresh_from_snapshot(self) -> None:
+        """
+        Refresh the cached name, availability and state from the latest coordinator data.
+        """
+        device = self.coordinator.get_device(self._device_uid)
+        if device is None:
+            self._attr_available = False
+            self._attr_is_on = None
+            return
         # Always use the latest name from coordinator data if available
-        snapshot_data = self.coordinator.data.get("snapshot_data", {}) if self.coordinator.data else {}
-        device_name_from_coordinator = None
-        if snapshot_data and "presentDemands" in snapshot_data and isinstance(snapshot_data["presentDemands"], list):
-            for dev_in_snapshot in snapshot_data["presentDemands"]:
-                if dev_in_snapshot.get("uid") == self._device_uid:
-                    device_name_from_coordinator = dev_in_snapshot.get("name")
-                    break
-        
-        base_name = device_name_from_coordinator or self._initial_name
-        return f"{base_name} Relay Status"
+        base_name = device.get("name") or self._initial_name
+        self._attr_name = f"{base_name} Relay Status"
+        self._attr_available = "percentCommanded" in device
+        self._attr_is_on = self._compute_value(device)
 
-    @property
-    def is_on(self):
+    async def async_added_to_hass(self) -> None:
         """
-        Return True if the relay is ON, based on percentCommanded == 100.
+        Publish this sensor's entity_id in the coordinator's shared relay index
+        and tell this device's breaker switch about it.
         """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device_uid:
-                    return device.get("percentCommanded") == 100
-        return None
+        await super().async_added_to_hass()
+        relay_entity_ids = self.coordinator.relay_entity_ids
+        relay_entity_ids[self._device_uid] = self.entity_id
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_RELAY_ENTITY_ID.format(self.coordinator.config_entry.entry_id, self._device_uid),
+            self.entity_id,
+        )
+        self.async_on_remove(lambda: relay_entity_ids.pop(self._device_uid, None))
 
-    @property
-    def available(self):
+    @staticmethod
+    def _compute_value(device: dict) -> bool:
         """
-        Return True if the entity is available (device present in snapshot).
+        Return True if the relay is ON, based on percentCommanded == 100.
         """
+        return device.get("percentCommanded") == 100
 
-        if not self.coordinator.last_update_success:
-            return False
-
-        if not self.coordinator.data:
-            return False
-            
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if not snapshot_data:
-            return False
-
-        if "presentDemands" not in snapshot_data or not isinstance(snapshot_data.get("presentDemands"), list):
-            return False
-        
-        if not snapshot_data["presentDemands"]:
-            return False
-
-        for device_in_list in snapshot_data["presentDemands"]:
-            if device_in_list.get("uid") == self._device_uid:
-                if "percentCommanded" in device_in_list:
-                    return True
-        
-        return False
-
-    @property
-    def icon(self):
-        return "mdi:toggle-switch-outline"
-
-    @property
-    def device_info(self) -> DeviceInfo:
+    @callback
+    def _handle_coordinator_update(self) -> None:
         """
-        Return dynamic DeviceInfo with the current device name and model.
+        Handle updated data from the coordinator.
+        Skips the state write when nothing visible about the entity changed.
         """
-        current_name_val = self._initial_name  # Default to initial name
-        current_capacity_val = self._initial_capacity  # Default to initial capacity
-
-        snapshot_data = self.coordinator.data.get("snapshot_data", {}) if self.coordinator.data else {}
-        if snapshot_data and "presentDemands" in snapshot_data and isinstance(snapshot_data["presentDemands"], list):
-            for device_in_snapshot in snapshot_data["presentDemands"]:
-                if device_in_snapshot.get("uid") == self._device_uid:
-                    current_name_val = device_in_snapshot.get("name", self._initial_name)
-                    current_capacity_val = device_in_snapshot.get("capacity", self._initial_capacity)
-                    break
-        
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._device_uid))},
-            name=current_name_val,
-            serial_number=self._dmx_uid,
-            manufacturer=MANUFACTURER,
-            model=get_device_model(current_capacity_val),
+        if not self.coordinator.device_changed(self._device_uid):
+            return
+        self._refresh_from_snapshot()
+        written = (
+            self._attr_is_on,
+            self._attr_available,
+            self._attr_name,
+            self.coordinator.last_update_success,
         )
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
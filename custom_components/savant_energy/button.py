@@ -8,16 +8,17 @@ from typing import Final
 from datetime import timedelta
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry  # type: ignore
 
+from homeassistant.components import persistent_notification  # type: ignore
 from homeassistant.components.button import ButtonEntity, ButtonDeviceClass  # type: ignore
 from homeassistant.config_entries import ConfigEntry  # type: ignore
 from homeassistant.const import EntityCategory  # type: ignore
-from homeassistant.core import HomeAssistant  # type: ignore
+from homeassistant.core import HomeAssistant, callback  # type: ignore
 from homeassistant.helpers.entity import DeviceInfo  # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback  # type: ignore
 from homeassistant.helpers.event import async_track_time_interval  # type: ignore
 
 from .const import DOMAIN, MANUFACTURER, DEFAULT_OLA_PORT, CONF_DMX_TESTING_MODE
-from .utils import async_set_dmx_values, get_dmx_api_stats
+from .utils import DMX_OFF_VALUE, DMX_ON_VALUE, async_set_dmx_values, get_dmx_api_stats
 from .scene import SavantSceneStorage, SavantSceneManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,15 +86,15 @@ class SavantSceneButton(ButtonEntity):
             if state and state.state not in ("unknown", "unavailable"):
                 try:
                     dmx_address = int(state.state)
-                    dmx_values[dmx_address] = "255" if is_on else "0"
+                    dmx_values[dmx_address] = DMX_ON_VALUE if is_on else DMX_OFF_VALUE
                 except (ValueError, TypeError):
                     _LOGGER.debug(f"Invalid DMX address value in sensor {dmx_sensor_id}: {state.state}")
                     fallback_addr = len(dmx_values) + 1
-                    dmx_values[fallback_addr] = "255" if is_on else "0"
+                    dmx_values[fallback_addr] = DMX_ON_VALUE if is_on else DMX_OFF_VALUE
             else:
                 _LOGGER.debug(f"DMX address sensor not found or unavailable for {dmx_sensor_id}, using scene state value")
                 fallback_addr = len(dmx_values) + 1
-                dmx_values[fallback_addr] = "255" if is_on else "0"
+                dmx_values[fallback_addr] = DMX_ON_VALUE if is_on else DMX_OFF_VALUE
 
         if not dmx_values:
             _LOGGER.warning(
@@ -135,31 +136,26 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     scene_manager = SavantSceneManager(hass, coordinator, storage)
     button_manager = SavantSceneButtonManager(hass, scene_manager, async_add_entities)
-    hass.data.setdefault(f"{DOMAIN}_scene_button_managers", {})[entry.entry_id] = (
-        button_manager
-    )
+    button_managers = hass.data.setdefault(f"{DOMAIN}_scene_button_managers", {})
+    button_managers[entry.entry_id] = button_manager
+    # Tie the refresh timer and registry entry to the config entry's lifetime
+    entry.async_on_unload(button_manager.async_stop)
+    entry.async_on_unload(lambda: button_managers.pop(entry.entry_id, None))
     await button_manager.async_setup()
 
-    # Always trigger a refresh to ensure polling starts
-    await coordinator.async_request_refresh()
-    if coordinator.data is not None:
-        snapshot_data = coordinator.data.get("snapshot_data", {})
-        if (
-            snapshot_data
-            and isinstance(snapshot_data, dict)
-            and "presentDemands" in snapshot_data
-        ):
-            async_add_entities(
-                [
-                    SavantAllLoadsButton(hass, coordinator),
-                    SavantApiCommandLogButton(hass, coordinator),
-                    SavantApiStatsButton(hass, coordinator),
-                ]
-            )
-        else:
-            _LOGGER.warning(
-                "No presentDemands data found in coordinator snapshot_data, buttons not added"
-            )
+    snapshot_data = (coordinator.data or {}).get("snapshot_data") or {}
+    if "presentDemands" not in snapshot_data:
+        _LOGGER.warning(
+            "No presentDemands data found in coordinator snapshot_data, buttons not added"
+        )
+        return
+    async_add_entities(
+        [
+            SavantAllLoadsButton(hass, coordinator),
+            SavantApiCommandLogButton(hass, coordinator),
+            SavantApiStatsButton(hass, coordinator),
+        ]
+    )
 
 
 class SavantSceneButtonManager:
@@ -229,11 +225,16 @@ class SavantSceneButtonManager:
 
         self._last_scene_ids = current_scene_ids
 
-    async def async_unload(self):
+    @callback
+    def async_stop(self):
+        """Cancel the periodic refresh."""
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
 
+    async def async_unload(self):
+        self.async_stop()
+
         for button in self.buttons.values():
             await (
                 button.async_remove()
@@ -288,7 +289,7 @@ class SavantAllLoadsButton(ButtonEntity):
                 try:
                     dmx_address = int(state.state)
                     # Set this DMX address to "on"
-                    dmx_values[dmx_address] = "255"
+                    dmx_values[dmx_address] = DMX_ON_VALUE
                     if dmx_address > max_dmx_address:
                         max_dmx_address = dmx_address
                     _LOGGER.debug(
@@ -306,7 +307,7 @@ class SavantAllLoadsButton(ButtonEntity):
                 DEFAULT_CHANNEL_COUNT,
             )
             for addr in range(1, DEFAULT_CHANNEL_COUNT + 1):
-                dmx_values[addr] = "255"
+                dmx_values[addr] = DMX_ON_VALUE
             max_dmx_address = DEFAULT_CHANNEL_COUNT
 
         # Get IP address from config entry
@@ -493,17 +494,14 @@ class SavantApiStatsButton(ButtonEntity):
         )
 
         # Display a notification in Home Assistant
-        await self.hass.services.async_call(
-            "persistent_notification",
-            "create",
-            {
-                "title": "DMX API Statistics",
-                "message": f"""
+        persistent_notification.async_create(
+            self.hass,
+            f"""
 Success Rate: {stats["success_rate"]:.1f}%
 Total Requests: {stats["request_count"]}
 Failed Requests: {stats["failure_count"]}
 Last Success: {last_success}
                 """,
-                "notification_id": f"{DOMAIN}_api_stats",
-            },
+            title="DMX API Statistics",
+            notification_id=f"{DOMAIN}_api_stats",
         )
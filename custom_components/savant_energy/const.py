@@ -18,6 +18,10 @@ CONF_SWITCH_COOLDOWN = "switch_cooldown"  # Minimum seconds between relay toggle
 CONF_DMX_TESTING_MODE = "dmx_testing_mode"  # Enable advanced DMX testing mode
 CONF_DMX_ADDRESS_CACHE = "dmx_address_cache"  # Enable DMX address caching
 
+# Dispatcher signal sent when a relay status sensor publishes its entity_id
+# (format with the config entry id and the device uid)
+SIGNAL_RELAY_ENTITY_ID = f"{DOMAIN}_relay_entity_id_{{}}_{{}}"
+
 # Default values
 DEFAULT_SWITCH_COOLDOWN = 30  # Default cooldown of 30 seconds
 DEFAULT_PORT = 2000           # Default Savant energy port
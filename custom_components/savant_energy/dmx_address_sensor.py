@@ -5,16 +5,11 @@ All classes and functions are now documented for clarity and open source maintai
 """
 
 import logging
-from typing import Any, Optional
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
-from .models import get_device_model
-from .utils import async_get_dmx_address, slugify
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -22,140 +17,79 @@ class DMXAddressSensor(CoordinatorEntity, SensorEntity):
     """
     Representation of the DMX Address Sensor.
     Shows the DMX address assigned to a Savant relay device.
+    Backed by the shared DMX address coordinator; renames come from the energy coordinator.
     """
+    __slots__ = ("_uid", "_dmx_uid", "_energy_coordinator", "_last_written")
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:identifier"
 
-    def __init__(self, coordinator, device, unique_id, dmx_uid):
+    def __init__(self, coordinator, device, unique_id, dmx_uid, device_info):
         """
         Initialize the DMX Address sensor.
         Args:
-            coordinator: DataUpdateCoordinator
+            coordinator: SavantEnergyCoordinator (its DMX address coordinator drives this entity)
             device: Device dict from presentDemands
             unique_id: Unique entity ID
             dmx_uid: DMX UID for device
+            device_info: DeviceInfo shared by all entities of this device
         """
-        super().__init__(coordinator)
-        self._device = device
+        super().__init__(coordinator.dmx_address_coordinator)
+        self._energy_coordinator = coordinator
+        self._uid = device["uid"]
         self._attr_unique_id = unique_id
         self._dmx_uid = dmx_uid
-        self._dmx_address = None  # Will be populated on first update
         self._attr_native_unit_of_measurement = None
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(device["uid"]))},
-            name=device["name"],
-            serial_number=dmx_uid,
-            manufacturer=MANUFACTURER,
-            model=get_device_model(device.get("capacity", 0)),
-        )
-        self._slug_name = slugify(device["name"])
-
-    @property
-    def _current_device_name(self):
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    return device["name"]
-        return self._device["name"]
+        self._attr_device_info = device_info
+        self._attr_name = f"{device['name']} DMX Address"
+        self._last_written = None  # (address, name, update ok) last sent to HA
+        self._refresh_from_coordinators()
 
     # Do NOT override entity_id. Home Assistant manages entity_id and expects it to be settable.
-    # Only the name property is dynamic, so the UI/friendly_name updates on device rename.
+    # Only the name is dynamic, so the UI/friendly_name updates on device rename.
     # unique_id remains stable and is used for entity tracking.
-    @property
-    def name(self):
-        return f"{self._current_device_name} DMX Address"
-
-    @property
-    def name(self) -> str:
+    def _refresh_from_coordinators(self) -> None:
         """
-        Return the dynamic friendly name for the entity, based on the current device name.
+        Refresh the cached name and DMX address from the latest coordinator data.
         """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        device_name = self._device["name"]
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    device_name = device["name"]
-                    break
-        return f"{device_name} DMX Address"
+        device = self._energy_coordinator.get_device(self._uid)
+        if device is not None:
+            self._attr_name = f"{device['name']} DMX Address"
+        self._attr_native_value = (self.coordinator.data or {}).get(self._dmx_uid)
+        self._attr_available = self._attr_native_value is not None  # Until the address is known
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    @callback
+    def _handle_coordinator_update(self) -> None:
         """
-        Return dynamic DeviceInfo with the current device name.
+        Handle updated data from either coordinator.
+        Skips the state write when neither the address nor the name changed.
         """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        device_name = self._device["name"]
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    device_name = device["name"]
-                    break
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._device["uid"]))},
-            name=device_name,
-            serial_number=self._dmx_uid,
-            manufacturer=MANUFACTURER,
-            model=get_device_model(self._device.get("capacity", 0)),
+        self._refresh_from_coordinators()
+        written = (
+            self._attr_native_value,
+            self._attr_name,
+            self.coordinator.last_update_success,
         )
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
         """
         Called when entity is added to Home Assistant.
-        Fetches the DMX address from the API, respecting the DMX Address Cache option.
+        Also subscribes to the energy coordinator so device renames are picked up.
         """
         await super().async_added_to_hass()
-        # Check config option for DMX address cache
-        cache_enabled = False
-        config_entry = getattr(self.coordinator, 'config_entry', None)
-        if config_entry:
-            cache_enabled = config_entry.options.get(
-                "dmx_address_cache",
-                config_entry.data.get("dmx_address_cache", False)
+        self.async_on_remove(
+            self._energy_coordinator.async_add_listener(
+                self._handle_energy_update, self._uid
             )
-        # Only fetch if not cached or cache is disabled
-        if not cache_enabled or self._dmx_address is None:
-            await self._fetch_dmx_address()
-
-    async def _fetch_dmx_address(self):
-        """
-        Fetch the DMX address from the OLA/DMX API.
-        Updates the sensor state if successful.
-        """
-        if not self.coordinator.config_entry:
-            _LOGGER.warning(f"No config entry available for {self.name}")
-            return
-        ip_address = self.coordinator.config_entry.data.get("address")
-        ola_port = self.coordinator.config_entry.data.get("ola_port", 9090)
-        if not ip_address:
-            _LOGGER.warning(f"No IP address available for {self.name}")
-            return
-        universe = 1  # Default universe
-        address = await async_get_dmx_address(ip_address, ola_port, universe, self._dmx_uid)
-        if address is not None:
-            self._dmx_address = address
-            self.async_write_ha_state()
-            _LOGGER.info(f"Updated DMX address for {self.name}: {address}")
-        else:
-            _LOGGER.warning(f"Failed to fetch DMX address for {self.name}")
-
-    @property
-    def native_value(self):
-        """
-        Return the DMX address (int) or None if not available.
-        """
-        return self._dmx_address
-
-    @property
-    def icon(self):
-        """
-        Return the icon for the DMX address sensor.
-        """
-        return "mdi:identifier"
+        )
 
-    @property
-    def available(self):
+    @callback
+    def _handle_energy_update(self) -> None:
         """
-        Return True if the DMX address is available.
+        Handle an energy coordinator update; only this device's changes matter here.
         """
-        return self._dmx_address is not None
+        if self._energy_coordinator.device_changed(self._uid):
+            self._handle_coordinator_update()
@@ -6,6 +6,18 @@ All functions are now documented for clarity and open source maintainability.
 
 from typing import Union
 
+from homeassistant.helpers.entity import DeviceInfo  # type: ignore
+
+from .const import DOMAIN, MANUFACTURER
+
+# Known relay capacities (kW) -> model name; exact float matches only
+_MODEL_BY_CAPACITY: dict[float, str] = {
+    2.4: "Dual 20A Relay",
+    7.2: "30A Relay",
+    14.4: "60A Relay",
+}
+
+
 def get_device_model(capacity: Union[int, float, None]) -> str:
     """
     Determine device model based on relay capacity.
@@ -16,12 +28,22 @@ def get_device_model(capacity: Union[int, float, None]) -> str:
     """
     if capacity is None:
         return "Unknown"
-    match capacity:
-        case 2.4:
-            return "Dual 20A Relay"
-        case 7.2:
-            return "30A Relay"
-        case 14.4:
-            return "60A Relay"
-        case _:
-            return "Unknown Model"
+    return _MODEL_BY_CAPACITY.get(capacity, "Unknown Model")
+
+
+def build_device_info(device: dict, dmx_uid: str) -> DeviceInfo:
+    """
+    Build the DeviceInfo shared by every entity of a relay device.
+    Args:
+        device: Device dict from presentDemands
+        dmx_uid: DMX UID for device
+    Returns:
+        A DeviceInfo to pass to each entity constructor for this device.
+    """
+    return DeviceInfo(
+        identifiers={(DOMAIN, device["uid"])},  # uid is already a str
+        name=device["name"],
+        serial_number=dmx_uid,
+        manufacturer=MANUFACTURER,
+        model=get_device_model(device.get("capacity", 0)),
+    )
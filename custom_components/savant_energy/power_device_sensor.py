@@ -5,190 +5,132 @@ All classes and functions are now documented for clarity and open source maintai
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
     SensorStateClass,
 )
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
-from .models import get_device_model
-from .utils import slugify
-
 _LOGGER = logging.getLogger(__name__)
 
 
+class SensorSpec(NamedTuple):
+    """
+    Static description of one per-device sensor type.
+    """
+    sensor_type: str
+    unit: str | None
+    icon: str
+    state_class: SensorStateClass | None
+    transform: Callable[[Any], Any] | None
+
+
+def _kw_to_w(value: Any) -> int:
+    """
+    Convert a presentDemands power reading (kW) to whole watts.
+    """
+    return round(float(value) * 1000.0)
+
+
+# One entry per sensor created for every relay device, in creation order
+SENSOR_SPECS: tuple[SensorSpec, ...] = (
+    SensorSpec("power", "W", "mdi:lightning-bolt", SensorStateClass.MEASUREMENT, _kw_to_w),
+    SensorSpec("voltage", "V", "mdi:flash", SensorStateClass.MEASUREMENT, float),
+)
+
+_DEVICE_CLASS: dict[str, SensorDeviceClass] = {
+    "power": SensorDeviceClass.POWER,
+    "voltage": SensorDeviceClass.VOLTAGE,
+}
+
+
 class EnergyDeviceSensor(CoordinatorEntity, SensorEntity):
     """
     Representation of a Savant Energy Sensor (power or voltage).
     """
-    def __init__(self, coordinator, device, sensor_type, unique_id, dmx_uid):
+    # Own fields only; _attr_* values stay in the base classes' __dict__
+    __slots__ = ("_uid", "_sensor_type", "_transform", "_last_written")
+    def __init__(self, coordinator, device, spec: SensorSpec, unique_id, device_info):
         """
         Initialize the sensor.
         Args:
             coordinator: DataUpdateCoordinator
             device: Device dict from presentDemands
-            sensor_type: 'power' or 'voltage'
+            spec: SensorSpec entry from SENSOR_SPECS
             unique_id: Unique entity ID
-            dmx_uid: DMX UID for device
+            device_info: DeviceInfo shared by all entities of this device
         """
-        super().__init__(coordinator)
-        self._device = device
+        super().__init__(coordinator, context=device["uid"])
+        sensor_type = spec.sensor_type
+        self._uid = device["uid"]
         self._sensor_type = sensor_type
+        self._transform = spec.transform
         self._attr_name = f"{device['name']} {sensor_type.capitalize()}"
-        self._slug_name = slugify(device["name"])
         self._attr_unique_id = unique_id
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(device["uid"]))},
-            name=device["name"],
-            serial_number=dmx_uid,
-            manufacturer=MANUFACTURER,
-            model=get_device_model(device.get("capacity", 0)),
-        )
-        self._attr_native_unit_of_measurement = self._get_unit_of_measurement(sensor_type)
-        self._dmx_uid = dmx_uid
-
-    @property
-    def name(self) -> str:
-        """
-        Return the dynamic friendly name for the entity, based on the current device name.
-        """
-        # Try to get the latest device name from coordinator data
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        device_name = self._device["name"]
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    device_name = device["name"]
-                    break
-        return f"{device_name} {self._sensor_type.capitalize()}"
-
-    def _get_unit_of_measurement(self, sensor_type: str) -> str | None:
-        """
-        Return the unit of measurement for the sensor type.
-        """
-        match sensor_type:
-            case "voltage":
-                return "V"
-            case "power":
-                return "W"
-            case _:
-                return None
-
-    @property
-    def _current_device_name(self):
-        """
-        Fetch the current device name by UID from coordinator data.
-        """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    return device["name"]
-        return self._device["name"]
+        self._attr_device_info = device_info
+        self._attr_native_unit_of_measurement = spec.unit
+        self._attr_icon = spec.icon
+        self._attr_state_class = spec.state_class
+        self._attr_device_class = _DEVICE_CLASS.get(sensor_type)
+        self._last_written = None  # (value, available, name, update ok) last sent to HA
+        self._refresh_from_snapshot()
 
     # Do NOT override entity_id. Home Assistant manages entity_id and expects it to be settable.
-    # Only the name property is dynamic, so the UI/friendly_name updates on device rename.
+    # Only the name is dynamic, so the UI/friendly_name updates on device rename.
     # unique_id remains stable and is used for entity tracking.
-    @property
-    def name(self):
+    def _refresh_from_snapshot(self) -> None:
         """
-        Return the name of the sensor using the latest device name.
+        Refresh the cached name, availability and value from the latest coordinator data.
         """
-        return f"{self._current_device_name} {self._sensor_type.capitalize()}"
+        device = self.coordinator.get_device(self._uid)
+        if device is None:
+            self._attr_available = False
+            self._attr_native_value = None
+            return
+        self._attr_name = f"{device['name']} {self._sensor_type.capitalize()}"
+        self._attr_available = self._sensor_type in device
+        self._attr_native_value = self._compute_value(device)
 
-    @property
-    def state_class(self) -> SensorStateClass | None:
-        """
-        Return the state class of the sensor (always MEASUREMENT).
-        """
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def device_class(self) -> str | None:
-        """
-        Return the device class of the sensor (POWER or VOLTAGE).
-        """
-        match self._sensor_type:
-            case "power":
-                return SensorDeviceClass.POWER
-            case "voltage":
-                return SensorDeviceClass.VOLTAGE
-            case _:
-                return None
-
-    @property
-    def native_value(self) -> float | None:
-        """
-        Return the state of the sensor (power in W, voltage in V).
+    def _compute_value(self, device: dict) -> Any:
         """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    value = device.get(self._sensor_type)
-                    if self._sensor_type == "power" and value is not None:
-                        try:
-                            return round(float(value) * 1000.0)
-                        except (ValueError, TypeError):
-                            _LOGGER.error(
-                                "Invalid power value %s for device %s", 
-                                value, device["uid"]
-                            )
-                            return None
-                    if value is not None:
-                        try:
-                            return float(value)
-                        except (ValueError, TypeError):
-                            return value
-        return None
-
-    @property
-    def icon(self) -> str:
-        """
-        Return the icon for the sensor.
-        """
-        match self._sensor_type:
-            case "voltage":
-                return "mdi:flash"
-            case "power":
-                return "mdi:lightning-bolt"
-            case _:
-                return "mdi:gauge"
-
-    @property
-    def available(self) -> bool:
-        """
-        Return True if the sensor is available (device present in snapshot).
-        """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if not snapshot_data or "presentDemands" not in snapshot_data:
-            return False
-        for device in snapshot_data["presentDemands"]:
-            if device["uid"] == self._device["uid"]:
-                return self._sensor_type in device
-        return False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """
-        Return dynamic DeviceInfo with the current device name.
-        """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        device_name = self._device["name"]
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    device_name = device["name"]
-                    break
-        return DeviceInfo(
-            identifiers={(DOMAIN, str(self._device["uid"]))},
-            name=device_name,
-            serial_number=self._dmx_uid,
-            manufacturer=MANUFACTURER,
-            model=get_device_model(self._device.get("capacity", 0)),
+        Return the transformed reading for this sensor type from a device dict.
+        Args:
+            device: Device dict from presentDemands
+        Returns:
+            The sensor value (power in W, voltage in V) or None if missing/invalid.
+        """
+        value = device.get(self._sensor_type)
+        if value is None or self._transform is None:
+            return value
+        try:
+            return self._transform(value)
+        except (ValueError, TypeError):
+            _LOGGER.error(
+                "Invalid %s value %s for device %s",
+                self._sensor_type, value, device["uid"]
+            )
+            return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """
+        Handle updated data from the coordinator.
+        Skips the state write when nothing visible about the entity changed.
+        """
+        if not self.coordinator.device_changed(self._uid):
+            return
+        self._refresh_from_snapshot()
+        written = (
+            self._attr_native_value,
+            self._attr_available,
+            self._attr_name,
+            self.coordinator.last_update_success,
         )
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
@@ -11,12 +11,12 @@ Only use the integration's services or UI to manage Savant scenes.
 import logging
 import json
 import asyncio
-import voluptuous as vol  # type: ignore
-from typing import Any, Dict, Final, List, Optional
+from typing import Dict, Final, Optional
 import re # Added for name normalization
 
 from homeassistant.config_entries import ConfigEntry  # type: ignore
-from homeassistant.core import HomeAssistant, callback  # type: ignore
+from homeassistant.const import STATE_ON  # type: ignore
+from homeassistant.core import HomeAssistant  # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback  # type: ignore
 from homeassistant.helpers.storage import Store  # type: ignore
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry  # type: ignore
@@ -24,8 +24,8 @@ from homeassistant.components.http import HomeAssistantView  # type: ignore
 from .api import register_scene_services  # type: ignore
 from homeassistant.exceptions import HomeAssistantError  # type: ignore
 
-from .const import DOMAIN, MANUFACTURER, DEFAULT_OLA_PORT, CONF_DMX_TESTING_MODE
-from .utils import async_set_dmx_values, slugify
+from .const import DOMAIN, DEFAULT_OLA_PORT, CONF_DMX_TESTING_MODE
+from .utils import DMX_OFF_VALUE, DMX_ON_VALUE, async_set_dmx_values, slugify
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,7 +53,8 @@ class SavantScenesRestView(HomeAssistantView):
                 for scene_id, scene_data in storage.scenes.items()
             ]
             response = {"scenes": scenes_meta}
-            _LOGGER.debug(f"[REST] Returning scenes response: {json.dumps(response)}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"[REST] Returning scenes response: {json.dumps(response)}")
             return self.json(response)
         except Exception as e:
             _LOGGER.error(
@@ -261,8 +262,6 @@ async def async_setup_entry(
     Set up Savant Energy scene entities.
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    # Always trigger a refresh to ensure polling starts
-    await coordinator.async_request_refresh()
     if coordinator.data is not None:
         storage = SavantSceneStorage(hass)
         entity_registry = async_get_entity_registry(hass)
@@ -450,7 +449,8 @@ class SavantSceneStorage:
             data = await self.store.async_load()
             self.scenes = (data or {}).get("scenes", {})
             if scene_id in self.scenes:
-                _LOGGER.debug(f"[Storage] Found scene {scene_id} in storage. Current scenes before delete: {json.dumps(self.scenes)}")
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(f"[Storage] Found scene {scene_id} in storage. Current scenes before delete: {json.dumps(self.scenes)}")
                 del self.scenes[scene_id]
                 await self.store.async_save({"scenes": self.scenes})
                 self._last_saved_state = dict(self.scenes)
@@ -554,18 +554,15 @@ class SavantSceneManager:
 
             try:
                 dmx_address = int(state.state)
-            except Exception:
+            except (TypeError, ValueError):
                 continue
 
             # Use the entity_id (breaker id) as the key for relay_states lookup
             breaker_id = entity_id
             # If breaker_id is in relay_states, use its value, else ON (255)
-            value = (
-                255
-                if breaker_id not in relay_states
-                else (255 if relay_states[breaker_id] else 0)
+            dmx_values[dmx_address] = (
+                DMX_OFF_VALUE if not relay_states.get(breaker_id, True) else DMX_ON_VALUE
             )
-            dmx_values[dmx_address] = str(value)
 
         if not dmx_values:
             _LOGGER.warning(f"No DMX addresses found for scene {scene['name']}")
@@ -607,5 +604,5 @@ class SavantSceneManager:
             # Check if 'breaker' is in the entity_id or friendly_name
             friendly_name = state.attributes.get("friendly_name", "")
             if "breaker" in entity_id.lower() or "breaker" in friendly_name.lower():
-                devices[entity_id] = state.state == "on"
+                devices[entity_id] = state.state == STATE_ON
         return devices
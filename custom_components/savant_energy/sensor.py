@@ -5,18 +5,17 @@ All classes and functions are now documented for clarity and open source maintai
 """
 
 import logging
-import asyncio
 
-from homeassistant.helpers.entity import DeviceInfo  # type: ignore
-
-from .const import DOMAIN, MANUFACTURER
-from .models import get_device_model
-from .power_device_sensor import EnergyDeviceSensor
+from .const import DOMAIN
+from .power_device_sensor import EnergyDeviceSensor, SENSOR_SPECS
 from .dmx_address_sensor import DMXAddressSensor
 from .utils import calculate_dmx_uid
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coordinator-driven entities: no update serialization needed
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """
@@ -26,74 +25,47 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
-    power_sensors = []  # Track power sensors for utility meter creation
-    dmx_address_sensors = []  # Track DMX address sensors for concurrency
-
-    # Always trigger a refresh to ensure polling starts
-    await coordinator.async_request_refresh()
 
-    # Defensive: Only try to create entities if coordinator.data is not None
-    if coordinator.data is not None:
-        snapshot_data = coordinator.data.get("snapshot_data", {})
-        if (
-            snapshot_data
-            and isinstance(snapshot_data, dict)
-            and "presentDemands" in snapshot_data
-        ):
-            demands_str = str(snapshot_data["presentDemands"])
-            _LOGGER.debug(
-                "Processing presentDemands: %.50s... (total length: %d)",
-                demands_str,
-                len(demands_str),
-            )
-            for device in snapshot_data["presentDemands"]:
-                uid = device["uid"]
-                dmx_uid = calculate_dmx_uid(uid)
-                _LOGGER.debug(
-                    "Creating sensors for Savant Serial: %s", dmx_uid
-                )
+    snapshot_data = (coordinator.data or {}).get("snapshot_data") or {}
+    if "presentDemands" not in snapshot_data:
+        _LOGGER.debug("No presentDemands data found in coordinator")
+        return
+    demands = snapshot_data["presentDemands"]
 
-                # Create device info once for all sensors
-                device_info = DeviceInfo(
-                    identifiers={(DOMAIN, str(device["uid"]))},
-                    name=device["name"],
-                    serial_number=dmx_uid,
-                    manufacturer=MANUFACTURER,
-                    model=get_device_model(device.get("capacity", 0)),
-                )
+    _LOGGER.debug("Processing %d presentDemands entries", len(demands))
+    for device in demands:
+        uid = device["uid"]
+        dmx_uid = calculate_dmx_uid(uid)
+        _LOGGER.debug(
+            "Creating sensors for Savant Serial: %s", dmx_uid
+        )
 
-                # Create power sensor
-                power_sensor = EnergyDeviceSensor(
-                    coordinator, device, "power", f"SavantEnergy_{uid}_power", dmx_uid
-                )
-                entities.append(power_sensor)
-                power_sensors.append(power_sensor)
+        # Device info is shared with the binary_sensor and switch platforms
+        device_info = coordinator.get_device_info(device)
 
-                # Create voltage sensor
-                entities.append(
-                    EnergyDeviceSensor(
-                        coordinator,
-                        device,
-                        "voltage",
-                        f"SavantEnergy_{uid}_voltage",
-                        dmx_uid,
-                    )
-                )
-                
-                # Create DMX address sensor
-                dmx_sensor = DMXAddressSensor(
-                    coordinator,
-                    device,
-                    f"SavantEnergy_{uid}_dmx_address",
-                    dmx_uid,
-                )
-                dmx_address_sensors.append(dmx_sensor)
-                entities.append(dmx_sensor)
+        # Create one sensor per entry in SENSOR_SPECS (power, voltage)
+        entities.extend(
+            EnergyDeviceSensor(
+                coordinator,
+                device,
+                spec,
+                f"SavantEnergy_{uid}_{spec.sensor_type}",
+                device_info,
+            )
+            for spec in SENSOR_SPECS
+        )
 
-            # Add all entities at once
-            async_add_entities(entities)
-            _LOGGER.debug("Added %d sensor entities", len(entities))
+        # Create DMX address sensor
+        entities.append(
+            DMXAddressSensor(
+                coordinator,
+                device,
+                f"SavantEnergy_{uid}_dmx_address",
+                dmx_uid,
+                device_info,
+            )
+        )
 
-            return True
-        else:
-            _LOGGER.debug("No presentDemands data found in coordinator")
+    # Add all entities at once
+    async_add_entities(entities)
+    _LOGGER.debug("Added %d sensor entities", len(entities))
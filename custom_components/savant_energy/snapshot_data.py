@@ -4,69 +4,99 @@ Handles fetching and decoding the current energy snapshot from the Savant contro
 All functions are now documented for clarity and open source maintainability.
 """
 
-import socket
+import asyncio
 import base64
-import json
+import contextlib
 import logging
+import re
+
+from homeassistant.util.json import json_loads  # type: ignore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound for connecting and reading one snapshot from the controller
+SNAPSHOT_TIMEOUT_SECONDS = 5.0
+
+# The base64 payload runs from SET_ENERGY= to the end of that line
+_SET_ENERGY_RE = re.compile(rb"SET_ENERGY=([^\n]*)")
+
 
-def get_current_energy_snapshot(address, port):
+async def async_get_current_energy_snapshot(address, port, cache=None):
     """
     Retrieves the current energy snapshot from the Savant controller.
-    Connects via TCP, decodes the base64 payload, and parses the JSON.
+    Connects via asyncio TCP streams (no executor thread), decodes the base64
+    payload, and parses the JSON.
     Args:
         address: IP address of the Savant controller
         port: Port for the energy snapshot service
+        cache: Optional {"payload", "result"} dict owned by the caller; idle
+            controllers resend the same blob, so an unchanged payload reuses the
+            previous result. Callers must not mutate the returned dict.
     Returns:
         Parsed JSON data as a dict, or None on error.
     """
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.connect((address, port))
-            data = b""
-            while True:
-                chunk = s.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-                if data.count(b"\n") >= 2:
-                    break
+        # asyncio TCP transports already disable Nagle (TCP_NODELAY)
+        async with asyncio.timeout(SNAPSHOT_TIMEOUT_SECONDS):
+            reader, writer = await asyncio.open_connection(address, port)
+            try:
+                # Grow one buffer in place and only count newlines in the new chunk
+                data = bytearray()
+                newlines = 0
+                while newlines < 2:
+                    chunk = await reader.read(4096)
+                    if not chunk:
+                        break
+                    data += chunk
+                    newlines += chunk.count(b"\n")
+            finally:
+                writer.close()
+                with contextlib.suppress(OSError):
+                    await writer.wait_closed()
         if not data:
             return None
-        data_str = data.decode("utf-8")
-        # Extract the value of SET_ENERGY
-        if "SET_ENERGY=" in data_str:
-            data_str = data_str.split("SET_ENERGY=", 1)[1]
-        # Strip off everything after the newline that follows SET_ENERGY
-        if "\n" in data_str:
-            data_str = data_str.split("\n", 1)[0]
-        _LOGGER.debug(f"Data after decode length: {len(data_str)})")
-        if "\n" in data_str:
-            data_str = data_str.split("\n", 1)[1]
-        if data_str.startswith("SET_ENERGY="):
-            data_str = data_str[len("SET_ENERGY=") :]
+        # Work on the raw bytes; the payload is base64 (ASCII) so no utf-8 pass is needed
+        match = _SET_ENERGY_RE.search(data)
+        if match is None:
+            _LOGGER.error("No SET_ENERGY payload in response (length: %d)", len(data))
+            return None
+        data_str = match.group(1)
         _LOGGER.debug(
-            f"Processed data string: {data_str[:100]}... (length: {len(data_str)})"
+            "Processed data string: %.100r... (length: %d)", data_str, len(data_str)
         )
+        if cache is not None and data_str == cache["payload"]:
+            _LOGGER.debug("Snapshot payload unchanged, reusing parsed data")
+            return cache["result"]
         try:
-            decoded_string = base64.b64decode(data_str).decode("utf-8")
-            _LOGGER.debug(
-                f"Decoded string: {decoded_string[:100]}... (length: {len(decoded_string)})"
-            )
+            decoded = base64.b64decode(data_str)
         except base64.binascii.Error as e:
-            _LOGGER.error(f"Decode Error: {e}, Data Length: {len(data_str)}")
+            _LOGGER.error("Decode Error: %s, Data Length: %d", e, len(data_str))
             return None
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Decoded string: %.100s... (length: %d)",
+                decoded.decode("utf-8", "replace"),
+                len(decoded),
+            )
         try:
-            json_data = json.loads(decoded_string)
-            return json_data
-        except json.JSONDecodeError as e:
-            _LOGGER.error(f"JSON Error: {e}, JSON: {decoded_string}")
+            # orjson-backed and accepts bytes directly
+            json_data = json_loads(decoded)
+        except ValueError as e:
+            _LOGGER.error("JSON Error: %s, JSON: %r", e, decoded)
             return None
-    except socket.error as e:
-        _LOGGER.error(f"Socket Error: {e}")
+        if cache is not None:
+            cache["payload"] = data_str
+            cache["result"] = json_data
+        return json_data
+    except TimeoutError:
+        _LOGGER.warning(
+            "Timed out after %ss reading energy snapshot from %s:%s",
+            SNAPSHOT_TIMEOUT_SECONDS, address, port,
+        )
+        return None
+    except OSError as e:
+        _LOGGER.error("Socket Error: %s", e)
         return None
     except Exception as e:
-        _LOGGER.error(f"Unexpected Error: {e}")
+        _LOGGER.error("Unexpected Error: %s", e)
         return None
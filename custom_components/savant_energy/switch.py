@@ -5,22 +5,171 @@ Provides relay (breaker) switch entities for each device, with cooldown logic to
 All classes and methods are now documented for clarity and open source maintainability.
 """
 
+import asyncio
 import logging
-import time
-import math
 
+from homeassistant.components import persistent_notification
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import (
+    async_track_entity_registry_updated_event,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_SWITCH_COOLDOWN, DEFAULT_SWITCH_COOLDOWN, MANUFACTURER, DEFAULT_OLA_PORT, CONF_DMX_TESTING_MODE
-from .models import get_device_model
-from .utils import calculate_dmx_uid, async_set_dmx_values, async_get_dmx_address, slugify
+from .const import DOMAIN, SIGNAL_RELAY_ENTITY_ID, CONF_SWITCH_COOLDOWN, DEFAULT_SWITCH_COOLDOWN, DEFAULT_OLA_PORT, CONF_DMX_TESTING_MODE
+from .utils import (
+    DMX_OFF_VALUE,
+    DMX_ON_VALUE,
+    async_set_dmx_values,
+    calculate_dmx_uid,
+    slugify,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-_last_command_time = 0.0
+# Breaker commands arriving within this many seconds are sent as one DMX frame
+DMX_BATCH_WINDOW = 0.05
+
+
+def _build_dmx_states(coordinator) -> dict:
+    """
+    Build a dict of {dmx_address: value} for all devices from coordinator data.
+    Relay state is the breaker's last commanded/observed state, else the device's
+    percentCommanded in the energy snapshot; the address comes from the DMX address
+    coordinator. Devices without a known state default to ON.
+    Args:
+        coordinator: SavantEnergyCoordinator
+    Returns:
+        The full {dmx_address: value} frame for the current data.
+    """
+    dmx_states = {}
+    addresses = coordinator.dmx_address_coordinator.data or {}
+    relay_states = coordinator.relay_state_by_uid
+    snapshot_data = (coordinator.data or {}).get("snapshot_data") or {}
+
+    for device in snapshot_data.get("presentDemands") or ():
+        uid = device.get("uid")
+        if uid is None:
+            continue
+        dmx_address = addresses.get(calculate_dmx_uid(uid))
+        if dmx_address is None:
+            continue
+        is_on = relay_states.get(uid)
+        if is_on is None:
+            is_on = device.get("percentCommanded", 100) == 100
+        dmx_states[dmx_address] = DMX_ON_VALUE if is_on else DMX_OFF_VALUE
+
+    return dmx_states
+
+
+class _PendingDMXBatch:
+    """
+    Coalesces breaker commands of one config entry into a single DMX frame.
+    The first command opens a short window; every command in it waits for the
+    same send and gets its result. Frames are built and sent one at a time, so a
+    frame never carries a value older than one still being sent.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator):
+        self.hass = hass
+        self.coordinator = coordinator
+        self._targets = {}  # dmx_address -> (uid, value) for the open window
+        self._future = None
+        self._flush_handle = None
+        self._send_lock = asyncio.Lock()
+        # Frame for the current coordinator data; None until built or after a change
+        self._base_states = None
+        self._unsub_listeners = (
+            coordinator.async_add_listener(self.async_invalidate),
+            coordinator.dmx_address_coordinator.async_add_listener(self.async_invalidate),
+        )
+
+    @callback
+    def async_invalidate(self) -> None:
+        """
+        Drop the cached frame; called when device data, DMX addresses or an
+        observed relay state actually changed.
+        """
+        self._base_states = None
+
+    def _current_states(self) -> dict:
+        """
+        Return the frame for the current coordinator data, building it on demand.
+        """
+        if self._base_states is None:
+            self._base_states = _build_dmx_states(self.coordinator)
+        return self._base_states
+
+    async def async_send(self, uid, dmx_address: int, value: int) -> bool:
+        """
+        Queue a breaker value and wait until the frame containing it is sent.
+        """
+        self._targets[dmx_address] = (uid, value)
+        if self._future is None:
+            self._future = self.hass.loop.create_future()
+            self._flush_handle = self.hass.loop.call_later(DMX_BATCH_WINDOW, self._flush)
+        # Shielded so one cancelled caller does not cancel the shared send
+        return await asyncio.shield(self._future)
+
+    @callback
+    def _flush(self) -> None:
+        """
+        Close the window and send the collected targets.
+        """
+        targets, future = self._targets, self._future
+        self._targets, self._future, self._flush_handle = {}, None, None
+        self.hass.async_create_task(self._async_send_frame(targets, future))
+
+    @callback
+    def async_stop(self) -> None:
+        """
+        Cancel a pending window and stop following coordinator updates.
+        Commands still waiting for that window resolve as failed.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._future is not None and not self._future.done():
+            self._future.set_result(False)
+        self._targets, self._future = {}, None
+        for unsub in self._unsub_listeners:
+            unsub()
+        self._unsub_listeners = ()
+
+    async def _async_send_frame(self, targets: dict, future: asyncio.Future) -> None:
+        """
+        Send one full DMX frame and resolve the waiting commands.
+        """
+        success = False
+        try:
+            async with self._send_lock:
+                config_entry = self.coordinator.config_entry
+                ip_address = config_entry.data.get("address")
+                ola_port = config_entry.data.get("ola_port", DEFAULT_OLA_PORT)
+                dmx_testing_mode = config_entry.options.get(
+                    CONF_DMX_TESTING_MODE,
+                    config_entry.data.get(CONF_DMX_TESTING_MODE, False)
+                )
+                values = {address: value for address, (_, value) in targets.items()}
+                dmx_states = {**self._current_states(), **values}
+                success = await async_set_dmx_values(ip_address, dmx_states, ola_port, dmx_testing_mode)
+                if success:
+                    # Record the sent states before the next frame is built
+                    relay_states = self.coordinator.relay_state_by_uid
+                    for uid, value in targets.values():
+                        relay_states[uid] = value == DMX_ON_VALUE
+                    self._current_states().update(values)
+        except Exception as err:
+            _LOGGER.error("Error sending DMX frame: %s", err)
+            success = False
+        finally:
+            # Always resolve the waiters, or every command in this window hangs
+            if not future.done():
+                future.set_result(success)
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entities):
@@ -34,17 +183,14 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
         config_entry.data.get(CONF_SWITCH_COOLDOWN, DEFAULT_SWITCH_COOLDOWN),
     )
     entities = []
-    # Always trigger a refresh to ensure polling starts
-    await coordinator.async_request_refresh()
-    if coordinator.data is not None:
-        snapshot_data = coordinator.data.get("snapshot_data", {})
-        if (
-            snapshot_data
-            and isinstance(snapshot_data, dict)
-            and "presentDemands" in snapshot_data
-        ):
-            for device in snapshot_data["presentDemands"]:
-                entities.append(EnergyDeviceSwitch(hass, coordinator, device, cooldown))
+    dmx_batch = _PendingDMXBatch(hass, coordinator)
+    config_entry.async_on_unload(dmx_batch.async_stop)
+    snapshot_data = (coordinator.data or {}).get("snapshot_data") or {}
+    for device in snapshot_data.get("presentDemands") or ():
+        device_info = coordinator.get_device_info(device)
+        entities.append(
+            EnergyDeviceSwitch(hass, coordinator, device, cooldown, device_info, dmx_batch)
+        )
     async_add_entities(entities)
 
 
@@ -53,7 +199,22 @@ class EnergyDeviceSwitch(CoordinatorEntity, SwitchEntity):
     Representation of a Savant Energy Switch (breaker).
     Includes cooldown logic to prevent rapid toggling.
     """
-    def __init__(self, hass: HomeAssistant, coordinator, device, cooldown: int):
+    __slots__ = (
+        "_uid",
+        "_name",
+        "_cooldown",
+        "_dmx_batch",
+        "_cooldown_notification",
+        "_last_command_time",
+        "_last_written",
+        "_dmx_uid",
+        "_relay_entity_id",
+        "_last_commanded_state",
+        "_relay_known",
+        "_unsub_relay",
+    )
+
+    def __init__(self, hass: HomeAssistant, coordinator, device, cooldown: int, device_info, dmx_batch):
         """
         Initialize the switch.
         Args:
@@ -61,153 +222,170 @@ class EnergyDeviceSwitch(CoordinatorEntity, SwitchEntity):
             coordinator: DataUpdateCoordinator
             device: Device dict from presentDemands
             cooldown: Minimum seconds between toggles
+            device_info: DeviceInfo shared by all entities of this device
+            dmx_batch: _PendingDMXBatch shared by all breakers of this config entry
         """
-        super().__init__(coordinator)
-        self._hass = hass
-        self._device = device
+        super().__init__(coordinator, context=device["uid"])
+        self._uid = device["uid"]
+        self._name = device["name"]  # Last known device name
+        self._attr_name = f"{self._name} Breaker"
         self._cooldown = cooldown
+        self._last_command_time = 0.0  # Cooldown is tracked per breaker
+        self._last_written = None  # (is_on, available, name) last sent to HA
+        self._dmx_batch = dmx_batch
+        # Static part of the cooldown notification; only the message varies
+        self._cooldown_notification = {
+            "title": "Switch Action Delayed",
+            "notification_id": f"{DOMAIN}_cooldown_{self._uid}",
+        }
         self._attr_unique_id = f"{DOMAIN}_{device['uid']}_breaker"
-        self._dmx_uid = calculate_dmx_uid(device["uid"])
-        self._dmx_address = None
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, str(device["uid"]))},
-            name=device["name"],
-            manufacturer=MANUFACTURER,
-            model=get_device_model(
-                device.get("capacity", 0)
-            ),
-            serial_number=self._dmx_uid,
-        )
-        self._attr_is_on = self._get_relay_status_state()
+        self._dmx_uid = calculate_dmx_uid(self._uid)  # Key into the DMX address coordinator
+        self._attr_device_info = device_info
+        # Relay status entity_id, resolved once instead of scanning states
+        self._relay_entity_id = f"binary_sensor.{slugify(device['name'])}_relay_status"
+        # self.hass is only set once the entity is added
+        self._attr_is_on = self._relay_state_to_bool(hass.states.get(self._relay_entity_id))
+        self._relay_known = self._attr_is_on is not None  # Kept current by the relay subscription
         self._last_commanded_state = self._attr_is_on
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
-        )
-
-    @property
-    def _current_device_name(self):
-        """Get the latest device name from coordinator data by UID."""
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if snapshot_data and "presentDemands" in snapshot_data:
-            for device in snapshot_data["presentDemands"]:
-                if device["uid"] == self._device["uid"]:
-                    return device["name"]
-        return self._device["name"]
+        self._unsub_relay = None  # Cancels the relay state/registry subscriptions
 
     # Do NOT override entity_id. Home Assistant manages entity_id and expects it to be settable.
-    # Only the name property is dynamic, so the UI/friendly_name updates on device rename.
+    # Only the name is dynamic, so the UI/friendly_name updates on device rename.
     # unique_id remains stable and is used for entity tracking.
-    @property
-    def name(self):
-        return f"{self._current_device_name} Breaker"
+    def _refresh_name(self) -> None:
+        """
+        Refresh the cached breaker name from the latest coordinator data.
+        Keeps the last known name while the device is missing from the snapshot.
+        """
+        device = self.coordinator.get_device(self._uid)
+        if device is not None:
+            self._name = device["name"]
+            self._attr_name = f"{self._name} Breaker"
+
+    @staticmethod
+    def _relay_state_to_bool(state: State | None) -> bool | None:
+        """
+        Convert a relay status binary sensor state to True/False, or None if unknown.
+        """
+        if state is None:
+            return None
+        if state.state == STATE_ON:
+            return True
+        if state.state == STATE_OFF:
+            return False
+        return None
 
     def _get_relay_status_state(self) -> bool | None:
         """
         Get the state of the switch based on the relay status sensor, or None if unknown.
         """
-        for binary_sensor in self._hass.states.async_all("binary_sensor"):
-            if (
-                binary_sensor.attributes.get("uid") == self._device["uid"]
-            ):
-                if binary_sensor.state.lower() == "on":
-                    return True
-                elif binary_sensor.state.lower() == "off":
-                    return False
-                break
-        return None
+        return self._relay_state_to_bool(self.hass.states.get(self._relay_entity_id))
 
-    async def _get_dmx_address_from_sensor(self) -> int | None:
+    async def async_added_to_hass(self) -> None:
         """
-        Try to get the DMX address from the sensor entity for this device.
+        Subscribe to the relay status binary sensor of this device.
         """
-        dmx_address_entity_id = f"sensor.{slugify(self._current_device_name)}_dmx_address"
-        alternative_entity_id = f"sensor.savant_energy_{self._device['uid']}_dmx_address"
-        state = self._hass.states.get(dmx_address_entity_id)
-        if not state or state.state in ('unknown', 'unavailable'):
-            state = self._hass.states.get(alternative_entity_id)
-        if state and state.state not in ('unknown', 'unavailable'):
-            try:
-                return int(state.state)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid DMX address in sensor {state.entity_id}: {state.state}")
-        return None    
+        await super().async_added_to_hass()
+        # Resolve the relay sensor by the unique_id this integration assigns; that
+        # survives entity_id customisation. Before it is registered, fall back to
+        # the id published by the relay sensor and then the slug-derived id.
+        self._relay_entity_id = er.async_get(self.hass).async_get_entity_id(
+            "binary_sensor", DOMAIN, f"SavantEnergy_{self._uid}_relay_status"
+        ) or self.coordinator.relay_entity_ids.get(self._uid, self._relay_entity_id)
+        self._async_track_relay()
+        self.async_on_remove(self._async_untrack_relay)
+        # The relay sensor may be added after this switch; follow the id it publishes
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_RELAY_ENTITY_ID.format(self.coordinator.config_entry.entry_id, self._uid),
+                self._async_relay_entity_published,
+            )
+        )
 
-    async def _fetch_dmx_address(self) -> int | None:
+    @callback
+    def _async_track_relay(self) -> None:
         """
-        Fetch DMX address from sensor only.
+        Subscribe to state and registry changes of the cached relay status entity_id.
         """
-        address = await self._get_dmx_address_from_sensor()
-        if address is not None:
-            return address
-        _LOGGER.warning(f"No DMX address found in sensor for {self.name}")
-        return None
+        self._async_untrack_relay()
+        self._relay_known = self._get_relay_status_state() is not None
+        unsub_state = async_track_state_change_event(
+            self.hass, [self._relay_entity_id], self._async_relay_state_changed
+        )
+        unsub_registry = async_track_entity_registry_updated_event(
+            self.hass, [self._relay_entity_id], self._async_relay_registry_updated
+        )
+
+        def _unsub() -> None:
+            unsub_state()
+            unsub_registry()
+
+        self._unsub_relay = _unsub
+
+    @callback
+    def _async_untrack_relay(self) -> None:
+        """
+        Cancel the relay subscriptions, if any.
+        """
+        if self._unsub_relay is not None:
+            self._unsub_relay()
+            self._unsub_relay = None
 
-    async def _get_all_device_dmx_states(self, target_dmx_address=None, target_value=None):
-        """
-        Build a dict of {dmx_address: value} for all devices using only DMX Address and Relay Status sensors.
-        """
-        dmx_states = {}
-        max_address = 0
-        dmx_address_entities = [entity for entity in self._hass.states.async_all("sensor") if entity.entity_id.endswith("_dmx_address")]
-
-        for dmx_address_entity in dmx_address_entities:
-            if dmx_address_entity.state in ("unknown", "unavailable") or not dmx_address_entity.state:
-                continue
-            try:
-                dmx_address = int(dmx_address_entity.state)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid DMX address in sensor {dmx_address_entity.entity_id}: {dmx_address_entity.state}")
-                continue
-
-            entity_id = dmx_address_entity.entity_id
-            device_name = None
-            sensor_state = self._hass.states.get(entity_id)
-            if sensor_state and sensor_state.attributes.get("friendly_name"):
-                device_name = sensor_state.attributes.get("friendly_name").replace(" DMX Address", "")
-            if not device_name:
-                entity_name = entity_id.split(".", 1)[1].replace("_dmx_address", "")
-                device_name = entity_name.replace("_", " ").title()
-
-            relay_found = False
-            for binary_sensor in self._hass.states.async_all("binary_sensor"):
-                if binary_sensor.attributes.get("friendly_name") and f"{device_name} Relay Status" == binary_sensor.attributes.get("friendly_name"):
-                    relay_status_state = binary_sensor
-                    relay_found = True
-                    break
-
-            value = "255"
-            if relay_found and relay_status_state.state not in ("unknown", "unavailable"):
-                if relay_status_state.state.lower() == "on":
-                    value = "255"
-                elif relay_status_state.state.lower() == "off":
-                    value = "0"
-                _LOGGER.debug(f"Found relay status for {device_name}: {relay_status_state.state} (using value {value})")
-            else:
-                _LOGGER.debug(f"No relay status found for {device_name}, defaulting to ON")
-
-            dmx_states[dmx_address] = value
-            if dmx_address > max_address:
-                max_address = dmx_address
-
-        if target_dmx_address:
-            dmx_states[target_dmx_address] = target_value
-            if target_dmx_address > max_address:
-                max_address = target_dmx_address
-
-        return dmx_states, max_address
+    @callback
+    def _async_relay_entity_published(self, entity_id: str) -> None:
+        """
+        Switch to the entity_id the relay status sensor published, if it differs.
+        """
+        if entity_id == self._relay_entity_id:
+            return
+        self._relay_entity_id = entity_id
+        self._async_track_relay()
+        self._maybe_write()
+
+    @callback
+    def _async_relay_registry_updated(self, event: Event) -> None:
+        """
+        Re-point the cached relay entity_id when the relay status sensor is renamed.
+        """
+        if event.data["action"] != "update" or "old_entity_id" not in event.data:
+            return
+        self._relay_entity_id = event.data["entity_id"]
+        self._async_track_relay()
+        self._maybe_write()
+
+    @callback
+    def _async_relay_state_changed(self, event: Event) -> None:
+        """
+        Follow relay status changes; availability also depends on that sensor.
+        """
+        new_state = self._relay_state_to_bool(event.data["new_state"])
+        self._relay_known = new_state is not None
+        relay_states = self.coordinator.relay_state_by_uid
+        if new_state is not None and relay_states.get(self._uid) != new_state:
+            relay_states[self._uid] = new_state
+            self._dmx_batch.async_invalidate()
+        if new_state is not None and new_state != self._last_commanded_state:
+            self._attr_is_on = new_state
+            self._last_commanded_state = new_state
+        self._maybe_write()
+
+    def _get_dmx_address(self) -> int | None:
+        """
+        Return this breaker's DMX address from the DMX address coordinator, the
+        same source the rest of the DMX frame is built from.
+        """
+        address = (self.coordinator.dmx_address_coordinator.data or {}).get(self._dmx_uid)
+        if address is None:
+            _LOGGER.warning(f"No DMX address known for {self.name}")
+        return address
 
     async def _send_full_dmx_command(self, target_dmx_address, target_value):
         """
         Send a DMX command with the full state of all addresses.
+        Commands from any breaker issued within DMX_BATCH_WINDOW share one frame.
         """
-        dmx_states, max_address = await self._get_all_device_dmx_states(target_dmx_address, target_value)
-        ip_address = self.coordinator.config_entry.data.get("address")
-        ola_port = self.coordinator.config_entry.data.get("ola_port", DEFAULT_OLA_PORT)
-        dmx_testing_mode = self.coordinator.config_entry.options.get(
-            CONF_DMX_TESTING_MODE,
-            self.coordinator.config_entry.data.get(CONF_DMX_TESTING_MODE, False)
-        )
-        success = await async_set_dmx_values(ip_address, dmx_states, ola_port, dmx_testing_mode)
+        success = await self._dmx_batch.async_send(self._uid, target_dmx_address, target_value)
         if not success:
             _LOGGER.error(f"Failed to send DMX command for {self.name} at address {target_dmx_address}")
         return success
@@ -217,108 +395,95 @@ class EnergyDeviceSwitch(CoordinatorEntity, SwitchEntity):
         """
         Return True if the entity is available.
         """
-        snapshot_data = self.coordinator.data.get("snapshot_data", {})
-        if not snapshot_data or "presentDemands" not in snapshot_data:
-            return False
-        relay_state = self._get_relay_status_state()
-        if relay_state is None:
-            return False
-        return True
+        return self._relay_known and self.coordinator.get_device(self._uid) is not None
 
     @property
     def is_on(self) -> bool:
         """
         Return the state of the switch based on the relay status sensor.
+        Until that sensor reports, fall back to the coordinator's view of the relay.
         """
         if self._attr_is_on is not None:
             return self._attr_is_on
-        for binary_sensor in self._hass.states.async_all("binary_sensor"):
-            if (
-                binary_sensor.attributes.get("uid") == self._device["uid"]
-            ):
-                if binary_sensor.state.lower() == "on":
-                    return True
-                elif binary_sensor.state.lower() == "off":
-                    return False
-        return False
+        is_on = self.coordinator.relay_state_by_uid.get(self._uid)
+        if is_on is not None:
+            return is_on
+        device = self.coordinator.get_device(self._uid)
+        return device is not None and device.get("percentCommanded") == 100
 
     async def async_turn_on(self, **kwargs):
         """
         Turn the switch on.
         Implements cooldown logic to prevent rapid toggling.
         """
-        global _last_command_time
-        now = time.monotonic()
-        if now - _last_command_time < self._cooldown:
-            time_left = math.ceil(self._cooldown - (now - _last_command_time))
-            _LOGGER.debug("Cooldown active, ignoring turn_on command")
-            await self._hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "message": f"Action for {self._device['name']} was delayed. Please wait {time_left} seconds before trying again.",
-                    "title": "Switch Action Delayed",
-                    "notification_id": f"{DOMAIN}_cooldown_{self._device['uid']}",
-                },
-            )
-            return
-        if not self.is_on:
-            _last_command_time = now
-            dmx_address = await self._fetch_dmx_address()
-            if dmx_address is None:
-                _LOGGER.warning(f"Cannot turn on {self.name}: DMX address unknown")
-                return
-            _LOGGER.info(f"Turning ON {self.name} at DMX address {dmx_address}")
-            await self._send_full_dmx_command(dmx_address, "255")
-            self._attr_is_on = True
-            self._last_commanded_state = True
-            self.async_write_ha_state()
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs):
         """
         Turn the switch off.
         Implements cooldown logic to prevent rapid toggling.
         """
-        global _last_command_time
-        now = time.monotonic()
-        if now - _last_command_time < self._cooldown:
-            time_left = math.ceil(self._cooldown - (now - _last_command_time))
-            _LOGGER.debug("Cooldown active, ignoring turn_off command")
-            await self._hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {
-                    "message": f"Action for {self._device['name']} was delayed. Please wait {time_left} seconds before trying again.",
-                    "title": "Switch Action Delayed",
-                    "notification_id": f"{DOMAIN}_cooldown_{self._device['uid']}",
-                },
-            )
+        await self._async_set(False)
+
+    def _check_cooldown(self) -> bool:
+        """
+        Return True if this breaker may be switched now.
+        Otherwise posts a notification with the remaining cooldown.
+        """
+        remaining = self._cooldown - (self.hass.loop.time() - self._last_command_time)
+        if remaining <= 0:
+            return True
+        time_left = int(remaining) + (remaining > int(remaining))  # ceil without math
+        persistent_notification.async_create(
+            self.hass,
+            f"Action for {self._name} was delayed. Please wait {time_left} seconds before trying again.",
+            **self._cooldown_notification,
+        )
+        return False
+
+    async def _async_set(self, on: bool) -> None:
+        """
+        Drive the breaker to the requested state via DMX, honouring the cooldown.
+        Args:
+            on: True to turn the breaker on, False to turn it off
+        """
+        action = "on" if on else "off"
+        if not self._check_cooldown():
+            _LOGGER.debug("Cooldown active, ignoring turn_%s command", action)
+            return
+        if self.is_on == on:
+            return
+        self._last_command_time = self.hass.loop.time()
+        dmx_address = self._get_dmx_address()
+        if dmx_address is None:
+            _LOGGER.warning(f"Cannot turn {action} {self.name}: DMX address unknown")
             return
-        if self.is_on:
-            _last_command_time = now
-            dmx_address = await self._fetch_dmx_address()
-            if dmx_address is None:
-                _LOGGER.warning(f"Cannot turn off {self.name}: DMX address unknown")
-                return
-            _LOGGER.info(f"Turning OFF {self.name} at DMX address {dmx_address}")
-            await self._send_full_dmx_command(dmx_address, "0")
-            self._attr_is_on = False
-            self._last_commanded_state = False
-            self.async_write_ha_state()
+        _LOGGER.info(f"Turning {action.upper()} {self.name} at DMX address {dmx_address}")
+        # The batch records the sent state in relay_state_by_uid before the next frame
+        await self._send_full_dmx_command(dmx_address, DMX_ON_VALUE if on else DMX_OFF_VALUE)
+        self._attr_is_on = on
+        self._last_commanded_state = on
+        self._maybe_write()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """
         Handle updated data from the coordinator.
+        The relay state arrives through the relay status sensor subscription; this
+        only refreshes name and availability.
         """
-        new_state = None
-        for binary_sensor in self._hass.states.async_all("binary_sensor"):
-            if (
-                binary_sensor.attributes.get("uid") == self._device["uid"]
-            ):
-                new_state = binary_sensor.state.lower() == "on"
-                break
-        if new_state is not None and new_state != self._last_commanded_state:
-            self._attr_is_on = new_state
-            self._last_commanded_state = new_state
-            self.async_write_ha_state()
+        if not self.coordinator.device_changed(self._uid):
+            return
+        self._refresh_name()
+        self._maybe_write()
+
+    @callback
+    def _maybe_write(self) -> None:
+        """
+        Write state only if on/off, availability or name changed since the last write.
+        """
+        written = (self._attr_is_on, self.available, self._attr_name)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
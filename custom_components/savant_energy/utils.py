@@ -5,11 +5,12 @@ All utility functions are now documented for clarity and open source maintainabi
 
 import logging
 import asyncio
-import subprocess
+import contextlib
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import aiohttp
-from typing import List, Dict, Any, Optional, Final, Tuple, Union
+from typing import List, Dict, Any, Optional, Final, Union
 
 from .const import DEFAULT_OLA_PORT
 
@@ -39,25 +40,25 @@ _api_request_count: int = 0
 _dmx_address_cache = {}  # Maps DMX UID -> {"address": int, "timestamp": datetime}
 
 
+@lru_cache(maxsize=256)
 def calculate_dmx_uid(uid: str) -> str:
     """
     Calculate the DMX UID based on the device UID, incrementing as hex if needed.
+    The result only depends on the UID, so it is memoized across platforms and reloads.
     Args:
         uid: Device UID string
     Returns:
         DMX UID string in the format XXXX:YYYYYY
     """
-    base_uid = uid.split(".")[0]
-    base_uid = f"{base_uid[:4]}:{base_uid[4:]}"
-    if uid.endswith(".1"):
-        prefix = base_uid[:-2]
-        last_two = base_uid[-2:]
+    base, _, _ = uid.partition(".")
+    head, tail = base[:4], base[4:]
+    if uid.endswith(".1") and len(tail) >= 2:
+        # Second relay of a dual device: the DMX UID is one higher in the last hex byte
         try:
-            incremented = f"{int(last_two, 16) + 1:02X}"
-        except Exception:
-            incremented = last_two
-        base_uid = prefix + incremented
-    return base_uid
+            tail = f"{tail[:-2]}{int(tail[-2:], 16) + 1:02X}"
+        except ValueError:
+            pass
+    return f"{head}:{tail}"
 
 
 def slugify(name: str) -> str:
@@ -72,7 +73,13 @@ def slugify(name: str) -> str:
     return name
 
 
-async def async_get_dmx_address(ip_address: str, ola_port: int, universe: int, dmx_uid: str) -> Optional[int]:
+async def async_get_dmx_address(
+    ip_address: str,
+    ola_port: int,
+    universe: int,
+    dmx_uid: str,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Optional[int]:
     """
     Get DMX address for a device using the RDM API.
     Args:
@@ -80,6 +87,7 @@ async def async_get_dmx_address(ip_address: str, ola_port: int, universe: int, d
         ola_port: OLA server port
         universe: DMX universe ID (usually 1)
         dmx_uid: The DMX UID of the device
+        session: Shared aiohttp session to reuse; a temporary one is opened if omitted
     Returns:
         The DMX address as an integer or None if not found
     """
@@ -103,7 +111,9 @@ async def async_get_dmx_address(ip_address: str, ola_port: int, universe: int, d
     #_LOGGER.debug(f"Fetching DMX address from: {url}")
     
     try:
-        async with aiohttp.ClientSession() as session:
+        async with contextlib.AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(aiohttp.ClientSession())
             async with session.get(url, timeout=10) as response:
                 if response.status == 200:
                     text_response = await response.text()
@@ -283,12 +293,13 @@ async def _execute_curl_command(cmd: str) -> tuple[int, str, str]:
     return process.returncode, stdout.decode(), stderr.decode()
 
 
-async def async_set_dmx_values(ip_address: str, channel_values: Dict[int, str], ola_port: int = 9090, testing_mode: bool = False) -> bool:
+async def async_set_dmx_values(ip_address: str, channel_values: Dict[int, Union[int, str]], ola_port: int = 9090, testing_mode: bool = False) -> bool:
     """
     Set DMX values for channels.
     Args:
         ip_address: IP address of the OLA server
-        channel_values: Dictionary mapping channel numbers (starting at 1) to values
+        channel_values: Dictionary mapping channel numbers (starting at 1) to DMX_ON_VALUE/DMX_OFF_VALUE
+            (the legacy strings "255"/"1"/"on" are still accepted as on)
         ola_port: Port for the OLA server
         testing_mode: If True, only log the command without executing it
     Returns:
@@ -300,16 +311,17 @@ async def async_set_dmx_values(ip_address: str, channel_values: Dict[int, str],
     try:
         max_channel = max(channel_values.keys()) if channel_values else 0
         
-        value_array = ["0"] * max_channel
+        # One byte per channel (0 or 255), only stringified when building the request
+        frame = bytearray(max_channel)
         
         for channel, value in channel_values.items():
-            if 1 <= channel <= max_channel:
-                if str(value) == "255" or str(value).lower() == "on" or str(value) == "1":
-                    value_array[channel-1] = "255"
-                else:
-                    value_array[channel-1] = "0"
+            if 1 <= channel <= max_channel and (
+                value == DMX_ON_VALUE
+                or (isinstance(value, str) and value.lower() in ("255", "1", "on"))
+            ):
+                frame[channel-1] = DMX_ON_VALUE
         
-        data_param = ",".join(value_array)
+        data_param = ",".join(map(str, frame))
         
         cmd = f'curl -X POST -d "u=1&d={data_param}" http://{ip_address}:{ola_port}/set_dmx'
         